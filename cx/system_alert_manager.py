@@ -19,6 +19,7 @@ Features:
 - Thread-safe operations for concurrent access
 """
 
+import copy
 import datetime
 import hashlib
 import hmac
@@ -42,6 +43,11 @@ from decimal import Decimal
 
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator, see requirements.txt
+    orjson = None
+
 console = Console()
 
 # Configure enterprise logging
@@ -55,6 +61,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# How long a connection waits on a locked database before raising
+SQLITE_BUSY_TIMEOUT_SECONDS = 5.0
+
+# How long get_alert_stats() results are reused when no alert was written
+ALERT_STATS_CACHE_TTL_SECONDS = 5.0
+
+# How long a health_check() result is reused before the system is re-probed
+HEALTH_CHECK_INTERVAL_SECONDS = 5.0
+
+# Maximum IDs bound into a single "IN (...)" clause (SQLite's historical limit is 999)
+SQLITE_MAX_IN_PARAMS = 500
+
+# alert_metrics retention: keep the newest rows, pruning every N inserted rows
+DEFAULT_MAX_METRIC_ROWS = 100_000
+METRIC_PRUNE_INTERVAL = 1024
+
 
 class SecurityConfig:
     """Enterprise security configuration."""
@@ -71,12 +93,13 @@ class SecurityConfig:
         """Get or create encryption key for sensitive data."""
         key_file = Path.home() / ".cortex" / "alert_encryption.key"
 
-        if key_file.exists():
-            try:
-                with open(key_file, 'rb') as f:
-                    return f.read()
-            except Exception as e:
-                logger.warning(f"Failed to read encryption key, generating new: {e}")
+        try:
+            with open(key_file, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to read encryption key, generating new: {e}")
 
         # Generate new key
         key = Fernet.generate_key()
@@ -93,6 +116,24 @@ class SecurityConfig:
         return key
 
 
+def _json_loads(data: str) -> Any:
+    """Parse a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # rows written by json.dumps may contain NaN/Infinity literals
+    return json.loads(data)
+
+
+# Precompiled validation patterns
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')  # RFC 5322 (simplified)
+_USER_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# str.translate table that drops control characters except newlines and tabs
+_CONTROL_CHAR_TABLE = {code: None for code in range(32) if chr(code) not in '\n\t'}
+
+
 class SecurityValidator:
     """Enterprise input validation and sanitization."""
 
@@ -102,9 +143,7 @@ class SecurityValidator:
         if not email or len(email) > 254:
             return False
 
-        # RFC 5322 compliant regex (simplified)
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
 
     @staticmethod
     def validate_user_id(user_id: str) -> bool:
@@ -112,7 +151,7 @@ class SecurityValidator:
         if not user_id or len(user_id) > 128:
             return False
         # Allow alphanumeric, hyphens, underscores
-        return bool(re.match(r'^[a-zA-Z0-9_-]+$', user_id))
+        return bool(_USER_ID_RE.match(user_id))
 
     @staticmethod
     def validate_amount(amount: Union[Decimal, float, str]) -> bool:
@@ -130,7 +169,7 @@ class SecurityValidator:
             return ""
 
         # Remove control characters except newlines and tabs
-        cleaned = ''.join(char for char in text if ord(char) >= 32 or char in '\n\t')
+        cleaned = text.translate(_CONTROL_CHAR_TABLE)
 
         # Truncate to max length
         return cleaned[:max_length]
@@ -140,19 +179,26 @@ class SecurityValidator:
         """Validate JSON metadata for security."""
         if metadata is None:
             return True
+        return SecurityValidator.serialize_json_metadata(metadata) is not None
 
+    @staticmethod
+    def serialize_json_metadata(metadata: Any) -> Optional[str]:
+        """Serialize JSON metadata, returning None if it fails validation."""
         try:
             # Ensure it can be serialized safely
             json_str = json.dumps(metadata)
+        except (TypeError, ValueError):
+            return None
 
-            # Check size limit (1MB)
-            if len(json_str) > 1024 * 1024:
-                return False
+        # Check size limit (1MB)
+        if len(json_str) > 1024 * 1024:
+            return None
 
-            # Basic structure validation
-            return isinstance(metadata, (dict, list, str, int, float, bool, type(None)))
-        except (TypeError, ValueError):
-            return False
+        # Basic structure validation
+        if not isinstance(metadata, (dict, list, str, int, float, bool, type(None))):
+            return None
+
+        return json_str
 
 
 class RateLimiter:
@@ -309,7 +355,7 @@ class RevenueEventType(Enum):
     REFERRAL_BONUS = "referral_bonus"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """User profile with referral tracking for Founding 1,000 ecosystem."""
     user_id: str
@@ -333,7 +379,7 @@ class UserProfile:
         return str(uuid.uuid4()).replace('-', '').upper()[:12]
 
 
-@dataclass
+@dataclass(slots=True)
 class RevenueEvent:
     """Revenue event for referral tracking and 10% attribution."""
     event_id: str
@@ -369,8 +415,14 @@ class SystemAlertManager:
     - Backup and recovery mechanisms
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
-        """Initialize the alert manager with enterprise security features."""
+    def __init__(self, db_path: Optional[Path] = None, max_metric_rows: int = DEFAULT_MAX_METRIC_ROWS):
+        """
+        Initialize the alert manager with enterprise security features.
+
+        Args:
+            db_path: Optional custom database path
+            max_metric_rows: Number of most recent alert_metrics rows to retain
+        """
         # Set up configuration directory
         self.config_dir = Path.home() / ".cortex"
         self.config_dir.mkdir(exist_ok=True, mode=0o700)  # Secure directory permissions
@@ -393,6 +445,20 @@ class SystemAlertManager:
         # Thread safety
         self._db_lock = threading.Lock()
 
+        # Metric retention
+        self.max_metric_rows = max_metric_rows
+        self._metric_rows_since_prune = 0
+
+        # get_alert_stats() memo: (monotonic time, alert write generation, stats)
+        self._alert_write_generation = 0
+        self._alert_stats_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None
+
+        # health_check() memo
+        self.health_check_interval = HEALTH_CHECK_INTERVAL_SECONDS
+        self._last_health_check: Optional[Dict[str, Any]] = None
+        self._last_check_monotonic = 0.0
+        self._health_check_lock = threading.Lock()
+
         # Performance monitoring
         self.operation_metrics = {
             'queries': 0,
@@ -413,15 +479,23 @@ class SystemAlertManager:
 
         logger.info("SystemAlertManager initialized with enterprise security")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the alert database."""
+        return sqlite3.connect(str(self.db_path), timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+
     def _init_database(self):
         """Initialize SQLite database schema."""
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             conn.row_factory = sqlite3.Row
 
             try:
                 cursor = conn.cursor()
 
+                # Connections are opened per call, so closing the last one would
+                # checkpoint WAL every time; keep (or restore) the rollback journal
+                cursor.execute("PRAGMA journal_mode = DELETE")
+
                 # Main alerts table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS alerts (
@@ -533,7 +607,10 @@ class SystemAlertManager:
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts(timestamp)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_type ON alerts(type)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_severity ON alerts(severity)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts(status)")
+                # Status-filtered listings and cleanup range-scan by timestamp within a status;
+                # its leading column also serves status-only lookups
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_status_time ON alerts(status, timestamp)")
+                cursor.execute("DROP INDEX IF EXISTS idx_alerts_status")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_type_time ON alert_metrics(metric_type, timestamp)")
 
                 # Indexes for referral tracking
@@ -542,6 +619,7 @@ class SystemAlertManager:
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_founding ON user_profiles(founding_member)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_revenue_user_time ON revenue_events(user_id, timestamp)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_revenue_referrer ON revenue_events(referrer_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_revenue_timestamp ON revenue_events(timestamp)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_referral_status ON referral_attributions(status)")
 
                 conn.commit()
@@ -601,11 +679,15 @@ class SystemAlertManager:
         if not message or len(message.strip()) == 0:
             raise ValidationException("Message is required")
 
-        if metadata is not None and not self.validator.validate_json_metadata(metadata):
-            raise ValidationException("Invalid metadata format or size")
+        # Serialize once: the validated JSON is what gets stored
+        metadata_json = None
+        if metadata is not None:
+            metadata_json = self.validator.serialize_json_metadata(metadata)
+            if metadata_json is None:
+                raise ValidationException("Invalid metadata format or size")
 
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
 
             try:
@@ -625,19 +707,20 @@ class SystemAlertManager:
                     source,
                     title,
                     message,
-                    json.dumps(metadata) if metadata else None,
+                    metadata_json if metadata else None,
                     now,
                     now
                 ))
 
                 alert_id = cursor.lastrowid
                 conn.commit()
+                self._alert_write_generation += 1
 
                 # Update metrics
                 self.operation_metrics['alerts_created'] += 1
 
                 # Log security events at higher severity
-                if severity == AlertSeverity.CRITICAL:
+                if severity is AlertSeverity.CRITICAL:
                     logger.warning(f"CRITICAL alert created: {alert_id} - {title}")
                 else:
                     logger.info(f"Alert created: {alert_id} - {title}")
@@ -678,7 +761,7 @@ class SystemAlertManager:
             True if successful
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             try:
                 cursor = conn.cursor()
                 now = datetime.datetime.now().isoformat()
@@ -699,6 +782,7 @@ class SystemAlertManager:
                 """, (alert_id, status.value, comment, now))
 
                 conn.commit()
+                self._alert_write_generation += 1
                 console.print(f"[green]✓[/green] Alert #{alert_id} status updated to {status.value}")
                 return True
 
@@ -709,6 +793,66 @@ class SystemAlertManager:
             finally:
                 conn.close()
 
+    def update_alerts_status(
+        self,
+        alert_ids: List[int],
+        status: AlertStatus,
+        comment: Optional[str] = None
+    ) -> int:
+        """
+        Update the status of several alerts in a single transaction.
+
+        Args:
+            alert_ids: Alert IDs to update
+            status: New status
+            comment: Optional comment logged for every updated alert
+
+        Returns:
+            Number of alerts updated (unknown IDs are skipped)
+        """
+        unique_ids = list(dict.fromkeys(alert_ids))
+        if not unique_ids:
+            return 0
+
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                cursor = conn.cursor()
+                now = datetime.datetime.now().isoformat()
+
+                # Resolve which IDs exist, staying under SQLite's bound-parameter limit
+                existing_ids = []
+                for start in range(0, len(unique_ids), SQLITE_MAX_IN_PARAMS):
+                    chunk = unique_ids[start:start + SQLITE_MAX_IN_PARAMS]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"SELECT id FROM alerts WHERE id IN ({placeholders})", chunk)
+                    existing_ids.extend(row[0] for row in cursor.fetchall())
+
+                if not existing_ids:
+                    console.print("[yellow]⚠️[/yellow] No matching alerts found")
+                    return 0
+
+                cursor.executemany("""
+                    UPDATE alerts SET status = ?, updated_at = ? WHERE id = ?
+                """, [(status.value, now, alert_id) for alert_id in existing_ids])
+
+                cursor.executemany("""
+                    INSERT INTO alert_actions (alert_id, action, comment, timestamp)
+                    VALUES (?, ?, ?, ?)
+                """, [(alert_id, status.value, comment, now) for alert_id in existing_ids])
+
+                conn.commit()
+                self._alert_write_generation += 1
+                console.print(f"[green]✓[/green] {len(existing_ids)} alert(s) status updated to {status.value}")
+                return len(existing_ids)
+
+            except Exception as e:
+                console.print(f"[red]✗[/red] Failed to update alert statuses: {e}")
+                conn.rollback()
+                return 0
+            finally:
+                conn.close()
+
     def query_alerts(
         self,
         status: Optional[AlertStatus] = None,
@@ -735,7 +879,7 @@ class SystemAlertManager:
             List of alert dictionaries
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             conn.row_factory = sqlite3.Row
 
             try:
@@ -769,14 +913,13 @@ class SystemAlertManager:
                 params.extend([limit, offset])
 
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
 
-                # Convert to list of dicts
+                # Convert rows to dicts as the cursor yields them
                 alerts = []
-                for row in rows:
+                for row in cursor:
                     alert = dict(row)
                     if alert['metadata']:
-                        alert['metadata'] = json.loads(alert['metadata'])
+                        alert['metadata'] = _json_loads(alert['metadata'])
                     alerts.append(alert)
 
                 return alerts
@@ -807,7 +950,7 @@ class SystemAlertManager:
             True if successful
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             try:
                 cursor = conn.cursor()
                 now = datetime.datetime.now().isoformat()
@@ -818,6 +961,7 @@ class SystemAlertManager:
                 """, (metric_type, value, unit, now, source))
 
                 conn.commit()
+                self._maybe_prune_metrics(conn, 1)
                 return True
 
             except Exception as e:
@@ -827,15 +971,95 @@ class SystemAlertManager:
             finally:
                 conn.close()
 
+    def record_metrics(
+        self,
+        metrics: List[Tuple[str, float, Optional[str], str]]
+    ) -> bool:
+        """
+        Record a batch of metric values in a single transaction.
+
+        Args:
+            metrics: (metric_type, value, unit, source) tuples
+
+        Returns:
+            True if successful
+        """
+        if not metrics:
+            return True
+
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                cursor = conn.cursor()
+                now = datetime.datetime.now().isoformat()
+
+                cursor.executemany("""
+                    INSERT INTO alert_metrics (metric_type, value, unit, timestamp, source)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [
+                    (metric_type, value, unit, now, source)
+                    for metric_type, value, unit, source in metrics
+                ])
+
+                conn.commit()
+                self._maybe_prune_metrics(conn, len(metrics))
+                return True
+
+            except Exception as e:
+                console.print(f"[red]✗[/red] Failed to record metrics: {e}")
+                conn.rollback()
+                return False
+            finally:
+                conn.close()
+
+    def _maybe_prune_metrics(self, conn: sqlite3.Connection, inserted: int):
+        """
+        Trim alert_metrics to the newest max_metric_rows rows every METRIC_PRUNE_INTERVAL inserts.
+
+        Runs in its own transaction after the inserted rows are committed, so a
+        failed prune never loses metrics and is retried on the next insert.
+        """
+        self._metric_rows_since_prune += inserted
+        if self._metric_rows_since_prune < METRIC_PRUNE_INTERVAL:
+            return
+
+        try:
+            # ids are monotonically increasing, so everything at or below the
+            # (max_metric_rows + 1)-th newest id is outside the retention window
+            cursor = conn.execute("""
+                DELETE FROM alert_metrics
+                WHERE id <= (SELECT id FROM alert_metrics ORDER BY id DESC LIMIT 1 OFFSET ?)
+            """, (self.max_metric_rows,))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.warning(f"Failed to prune old metric rows: {e}")
+            return
+
+        self._metric_rows_since_prune = 0
+        if cursor.rowcount > 0:
+            logger.info(f"Pruned {cursor.rowcount} old metric rows")
+
     def get_alert_stats(self) -> Dict[str, Any]:
         """
         Get summary statistics about alerts.
 
+        Results are reused for up to ALERT_STATS_CACHE_TTL_SECONDS as long as
+        this manager has not written any alerts in the meantime.
+
         Returns:
             Dictionary with alert counts by status, type, severity
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            cached = self._alert_stats_cache
+            if (
+                cached is not None
+                and cached[1] == self._alert_write_generation
+                and time.monotonic() - cached[0] < ALERT_STATS_CACHE_TTL_SECONDS
+            ):
+                return copy.deepcopy(cached[2])
+
+            conn = self._connect()
             conn.row_factory = sqlite3.Row
 
             try:
@@ -855,15 +1079,20 @@ class SystemAlertManager:
                 cursor.execute("SELECT severity, COUNT(*) as count FROM alerts GROUP BY severity")
                 stats['by_severity'] = {row['severity']: row['count'] for row in cursor.fetchall()}
 
-                # Total count
-                cursor.execute("SELECT COUNT(*) as total FROM alerts")
-                stats['total'] = cursor.fetchone()['total']
-
-                # Recent alerts (last 24 hours)
+                # Total count and recent alerts (last 24 hours) in a single scan
                 yesterday = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-                cursor.execute("SELECT COUNT(*) as recent FROM alerts WHERE timestamp >= ?", (yesterday,))
-                stats['recent_24h'] = cursor.fetchone()['recent']
-
+                cursor.execute("""
+                    SELECT COUNT(*) as total,
+                           COALESCE(SUM(CASE WHEN timestamp >= ? THEN 1 ELSE 0 END), 0) as recent
+                    FROM alerts
+                """, (yesterday,))
+                row = cursor.fetchone()
+                stats['total'] = row['total']
+                stats['recent_24h'] = row['recent']
+
+                self._alert_stats_cache = (
+                    time.monotonic(), self._alert_write_generation, copy.deepcopy(stats)
+                )
                 return stats
 
             except Exception as e:
@@ -883,7 +1112,7 @@ class SystemAlertManager:
             Number of alerts deleted
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             try:
                 cursor = conn.cursor()
 
@@ -897,6 +1126,7 @@ class SystemAlertManager:
 
                 deleted_count = cursor.rowcount
                 conn.commit()
+                self._alert_write_generation += 1
 
                 console.print(f"[green]✓[/green] Cleaned up {deleted_count} old resolved alerts")
                 return deleted_count
@@ -949,12 +1179,13 @@ class SystemAlertManager:
             raise ValidationException("Invalid referral code format")
 
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             conn.execute("PRAGMA foreign_keys = ON")
 
             try:
                 cursor = conn.cursor()
-                now = datetime.datetime.now().isoformat()
+                created_at = datetime.datetime.now()
+                now = created_at.isoformat()
 
                 # Check for duplicate user_id
                 cursor.execute("SELECT user_id FROM user_profiles WHERE user_id = ?", (user_id,))
@@ -984,7 +1215,7 @@ class SystemAlertManager:
                     tier=tier,
                     founding_member=founding_member,
                     referred_by=referred_by_code,
-                    created_at=datetime.datetime.now()
+                    created_at=created_at
                 )
 
                 cursor.execute("""
@@ -1068,14 +1299,18 @@ class SystemAlertManager:
             Event ID if successful, None if failed
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
+            conn.row_factory = sqlite3.Row
             try:
                 cursor = conn.cursor()
 
-                # Get user profile to check for referrer
+                # Get user profile and resolve the referrer's user_id in one query
                 cursor.execute("""
-                    SELECT user_id, referred_by, founding_member, tier
-                    FROM user_profiles WHERE user_id = ?
+                    SELECT up.referred_by, up.founding_member, up.tier,
+                           referrer.user_id as referrer_id
+                    FROM user_profiles up
+                    LEFT JOIN user_profiles referrer ON referrer.referral_code = up.referred_by
+                    WHERE up.user_id = ?
                 """, (user_id,))
 
                 user_row = cursor.fetchone()
@@ -1083,19 +1318,10 @@ class SystemAlertManager:
                     console.print(f"[yellow]⚠️[/yellow] User {user_id} not found for revenue event")
                     return None
 
-                referred_by_code = user_row[1]
-                founding_member = bool(user_row[2])
-                user_tier = user_row[3]
-
-                # Get referrer user_id if exists
-                referrer_id = None
-                if referred_by_code:
-                    cursor.execute("""
-                        SELECT user_id FROM user_profiles WHERE referral_code = ?
-                    """, (referred_by_code,))
-                    referrer_row = cursor.fetchone()
-                    if referrer_row:
-                        referrer_id = referrer_row[0]
+                referred_by_code = user_row['referred_by']
+                founding_member = bool(user_row['founding_member'])
+                user_tier = user_row['tier']
+                referrer_id = user_row['referrer_id']
 
                 # Create revenue event
                 event = RevenueEvent(
@@ -1107,6 +1333,7 @@ class SystemAlertManager:
                     referrer_id=referrer_id,
                     metadata=metadata
                 )
+                event_timestamp = event.timestamp.isoformat()
 
                 cursor.execute("""
                     INSERT INTO revenue_events (
@@ -1122,7 +1349,7 @@ class SystemAlertManager:
                     event.referrer_id,
                     float(event.referral_bonus) if event.referral_bonus else None,
                     json.dumps(event.metadata) if event.metadata else None,
-                    event.timestamp.isoformat(),
+                    event_timestamp,
                     0
                 ))
 
@@ -1139,7 +1366,7 @@ class SystemAlertManager:
                         event.event_id,
                         float(event.referral_bonus),
                         'pending',
-                        datetime.datetime.now().isoformat()
+                        event_timestamp
                     ))
 
                     # Update referrer's lifetime revenue
@@ -1192,7 +1419,7 @@ class SystemAlertManager:
             Dictionary with referral statistics
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             conn.row_factory = sqlite3.Row
 
             try:
@@ -1254,7 +1481,7 @@ class SystemAlertManager:
             Dictionary with Founding 1,000 metrics
         """
         with self._db_lock:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             conn.row_factory = sqlite3.Row
 
             try:
@@ -1262,20 +1489,17 @@ class SystemAlertManager:
 
                 stats = {}
 
-                # Total founding members
-                cursor.execute("SELECT COUNT(*) as count FROM user_profiles WHERE founding_member = 1")
-                stats['founding_members'] = cursor.fetchone()['count']
-
-                # Total referrals by founding members
+                # Founding member count, their referrals, and total referral revenue
                 cursor.execute("""
-                    SELECT SUM(total_referrals) as total
-                    FROM user_profiles WHERE founding_member = 1
+                    SELECT SUM(CASE WHEN founding_member = 1 THEN 1 ELSE 0 END) as founding_members,
+                           SUM(CASE WHEN founding_member = 1 THEN total_referrals END) as founding_referrals,
+                           SUM(lifetime_referral_revenue) as referral_revenue
+                    FROM user_profiles
                 """)
-                stats['total_founding_referrals'] = cursor.fetchone()['total'] or 0
-
-                # Total referral revenue generated
-                cursor.execute("SELECT SUM(lifetime_referral_revenue) as total FROM user_profiles")
-                stats['total_referral_revenue'] = cursor.fetchone()['total'] or 0.0
+                row = cursor.fetchone()
+                stats['founding_members'] = row['founding_members'] or 0
+                stats['total_founding_referrals'] = row['founding_referrals'] or 0
+                stats['total_referral_revenue'] = row['referral_revenue'] or 0.0
 
                 # Revenue by tier
                 cursor.execute("""
@@ -1340,7 +1564,7 @@ class SystemAlertManager:
 
             with self._db_lock:
                 # Use SQLite backup API for consistent backup
-                source_conn = sqlite3.connect(str(self.db_path))
+                source_conn = self._connect()
                 backup_conn = sqlite3.connect(str(backup_path))
 
                 try:
@@ -1381,7 +1605,7 @@ class SystemAlertManager:
         """
         try:
             with self._db_lock:
-                conn = sqlite3.connect(str(self.db_path))
+                conn = self._connect()
                 try:
                     cursor = conn.cursor()
 
@@ -1417,7 +1641,7 @@ class SystemAlertManager:
         """
         try:
             with self._db_lock:
-                conn = sqlite3.connect(str(self.db_path))
+                conn = self._connect()
                 conn.row_factory = sqlite3.Row
 
                 try:
@@ -1427,14 +1651,12 @@ class SystemAlertManager:
                     db_size = self.db_path.stat().st_size
 
                     # Table counts
-                    cursor.execute("SELECT COUNT(*) as count FROM alerts")
-                    alert_count = cursor.fetchone()['count']
-
-                    cursor.execute("SELECT COUNT(*) as count FROM user_profiles")
-                    user_count = cursor.fetchone()['count']
-
-                    cursor.execute("SELECT COUNT(*) as count FROM revenue_events")
-                    revenue_count = cursor.fetchone()['count']
+                    cursor.execute("""
+                        SELECT (SELECT COUNT(*) FROM alerts) as alert_count,
+                               (SELECT COUNT(*) FROM user_profiles) as user_count,
+                               (SELECT COUNT(*) FROM revenue_events) as revenue_count
+                    """)
+                    alert_count, user_count, revenue_count = cursor.fetchone()
 
                     # Performance stats
                     metrics = {
@@ -1484,7 +1706,7 @@ class SystemAlertManager:
 
         try:
             with self._db_lock:
-                conn = sqlite3.connect(str(self.db_path))
+                conn = self._connect()
                 conn.row_factory = sqlite3.Row
 
                 try:
@@ -1560,9 +1782,26 @@ class SystemAlertManager:
         """
         Comprehensive health check of the alert manager system.
 
+        A result is reused for up to health_check_interval seconds so that
+        callers polling from several threads do not re-probe the system;
+        concurrent callers wait for the probe in progress.
+
         Returns:
             Dictionary with health status
         """
+        with self._health_check_lock:
+            now = time.monotonic()
+            cached = self._last_health_check
+            if cached is not None and now - self._last_check_monotonic < self.health_check_interval:
+                return copy.deepcopy(cached)
+
+            health = self._run_health_check()
+            self._last_health_check = copy.deepcopy(health)
+            self._last_check_monotonic = now
+            return health
+
+    def _run_health_check(self) -> Dict[str, Any]:
+        """Probe database, permissions, encryption and metrics."""
         health = {
             'status': 'healthy',
             'checks': {},
@@ -1570,17 +1809,24 @@ class SystemAlertManager:
         }
 
         try:
+            # Performance metrics query the database, so a successful result
+            # also proves connectivity; only probe separately when it fails
+            metrics = self.get_performance_metrics()
+
             # Database connectivity
-            try:
-                with self._db_lock:
-                    conn = sqlite3.connect(str(self.db_path))
-                    conn.execute("SELECT 1")
-                    conn.close()
+            if 'error' in metrics:
+                try:
+                    with self._db_lock:
+                        conn = self._connect()
+                        conn.execute("SELECT 1")
+                        conn.close()
+                    health['checks']['database_connectivity'] = True
+                except Exception as e:
+                    health['checks']['database_connectivity'] = False
+                    health['status'] = 'degraded'
+                    logger.error(f"Database connectivity check failed: {e}")
+            else:
                 health['checks']['database_connectivity'] = True
-            except Exception as e:
-                health['checks']['database_connectivity'] = False
-                health['status'] = 'degraded'
-                logger.error(f"Database connectivity check failed: {e}")
 
             # File permissions
             try:
@@ -1614,7 +1860,6 @@ class SystemAlertManager:
             }
 
             # Performance metrics
-            metrics = self.get_performance_metrics()
             if 'error' in metrics:
                 health['checks']['performance_monitoring'] = False
                 health['status'] = 'degraded'
@@ -1634,14 +1879,18 @@ class SystemAlertManager:
 
 
 # Global instance for easy access
-_alert_manager_instance = None
+_alert_manager_instance: Optional[SystemAlertManager] = None
+_alert_manager_lock = threading.Lock()
 
 
 def get_alert_manager() -> SystemAlertManager:
     """Get global alert manager instance (singleton pattern)."""
     global _alert_manager_instance
     if _alert_manager_instance is None:
-        _alert_manager_instance = SystemAlertManager()
+        # Concurrent first calls must share one manager (and one _db_lock)
+        with _alert_manager_lock:
+            if _alert_manager_instance is None:
+                _alert_manager_instance = SystemAlertManager()
     return _alert_manager_instance
 
 
@@ -20,22 +20,39 @@ License: MIT
 
 import datetime
 import json
+import operator
 import psutil
 import shutil
 import threading
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
 from rich.console import Console
 
-from cx.system_alert_manager import get_alert_manager, AlertType, AlertSeverity, AlertStatus
+from cx.system_alert_manager import (
+    get_alert_manager,
+    SystemAlertManager,
+    AlertType,
+    AlertSeverity,
+    AlertStatus,
+)
 
 console = Console()
 
+# Comparison functions for ThresholdRule.operator
+_OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ThresholdRule:
     """Configuration for a threshold rule."""
     name: str
@@ -48,7 +65,67 @@ class ThresholdRule:
     description: str = ""
 
 
-@dataclass
+# Default rules with fixed thresholds; the load-average rule depends on the
+# CPU count and is added in ThresholdMonitor._create_default_rules
+_DEFAULT_RULE_SPECS: Tuple[MappingProxyType, ...] = tuple(MappingProxyType(spec) for spec in (
+    dict(
+        name="High CPU Usage",
+        metric_type="cpu_usage",
+        operator=">",
+        threshold=80.0,
+        severity=AlertSeverity.NORMAL,
+        cooldown_minutes=5,
+        description="CPU usage above 80% for sustained period"
+    ),
+    dict(
+        name="Critical CPU Usage",
+        metric_type="cpu_usage",
+        operator=">",
+        threshold=95.0,
+        severity=AlertSeverity.CRITICAL,
+        cooldown_minutes=2,
+        description="CPU usage above 95% - system may be unresponsive"
+    ),
+    dict(
+        name="High Memory Usage",
+        metric_type="memory_usage",
+        operator=">",
+        threshold=85.0,
+        severity=AlertSeverity.NORMAL,
+        cooldown_minutes=5,
+        description="Memory usage above 85%"
+    ),
+    dict(
+        name="Critical Memory Usage",
+        metric_type="memory_usage",
+        operator=">",
+        threshold=95.0,
+        severity=AlertSeverity.CRITICAL,
+        cooldown_minutes=2,
+        description="Memory usage above 95% - risk of OOM"
+    ),
+    dict(
+        name="Low Disk Space",
+        metric_type="disk_free_gb",
+        operator="<",
+        threshold=5.0,
+        severity=AlertSeverity.NORMAL,
+        cooldown_minutes=30,
+        description="Less than 5GB free disk space"
+    ),
+    dict(
+        name="Critical Disk Space",
+        metric_type="disk_free_gb",
+        operator="<",
+        threshold=1.0,
+        severity=AlertSeverity.CRITICAL,
+        cooldown_minutes=15,
+        description="Less than 1GB free disk space"
+    ),
+))
+
+
+@dataclass(slots=True)
 class SystemMetric:
     """System metric measurement."""
     metric_type: str
@@ -77,8 +154,8 @@ class ThresholdMonitor:
         self.rules_file = self.config_dir / "threshold_rules.json"
         self.last_alert_file = self.config_dir / "last_alerts.json"
 
-        # Initialize components
-        self.alert_manager = get_alert_manager()
+        # Initialize components (alert manager is resolved on first use)
+        self._alert_manager: Optional[SystemAlertManager] = None
         self.rules: List[ThresholdRule] = []
         self.last_alert_times: Dict[str, datetime.datetime] = {}
 
@@ -91,94 +168,45 @@ class ThresholdMonitor:
         self._load_rules()
         self._load_last_alert_times()
 
+    @property
+    def alert_manager(self) -> SystemAlertManager:
+        """Alert manager used for metric and alert persistence."""
+        if self._alert_manager is None:
+            self._alert_manager = get_alert_manager()
+        return self._alert_manager
+
     def _load_rules(self):
         """Load threshold rules from configuration file."""
-        if self.rules_file.exists():
-            try:
-                with open(self.rules_file, 'r') as f:
-                    rules_data = json.load(f)
+        try:
+            with open(self.rules_file, 'r') as f:
+                rules_data = json.load(f)
 
-                self.rules = []
-                for rule_dict in rules_data:
-                    # Convert severity string to enum
-                    rule_dict['severity'] = AlertSeverity(rule_dict['severity'])
-                    self.rules.append(ThresholdRule(**rule_dict))
+            self.rules = []
+            for rule_dict in rules_data:
+                # Convert severity string to enum
+                rule_dict['severity'] = AlertSeverity(rule_dict['severity'])
+                self.rules.append(ThresholdRule(**rule_dict))
 
-                console.print(f"[green]✓[/green] Loaded {len(self.rules)} threshold rules")
+            console.print(f"[green]✓[/green] Loaded {len(self.rules)} threshold rules")
 
-            except Exception as e:
-                console.print(f"[yellow]⚠️[/yellow] Failed to load threshold rules: {e}")
-                self._create_default_rules()
-        else:
+        except FileNotFoundError:
+            self._create_default_rules()
+        except Exception as e:
+            console.print(f"[yellow]⚠️[/yellow] Failed to load threshold rules: {e}")
             self._create_default_rules()
 
     def _create_default_rules(self):
         """Create default threshold rules."""
-        default_rules = [
-            ThresholdRule(
-                name="High CPU Usage",
-                metric_type="cpu_usage",
-                operator=">",
-                threshold=80.0,
-                severity=AlertSeverity.NORMAL,
-                cooldown_minutes=5,
-                description="CPU usage above 80% for sustained period"
-            ),
-            ThresholdRule(
-                name="Critical CPU Usage",
-                metric_type="cpu_usage",
-                operator=">",
-                threshold=95.0,
-                severity=AlertSeverity.CRITICAL,
-                cooldown_minutes=2,
-                description="CPU usage above 95% - system may be unresponsive"
-            ),
-            ThresholdRule(
-                name="High Memory Usage",
-                metric_type="memory_usage",
-                operator=">",
-                threshold=85.0,
-                severity=AlertSeverity.NORMAL,
-                cooldown_minutes=5,
-                description="Memory usage above 85%"
-            ),
-            ThresholdRule(
-                name="Critical Memory Usage",
-                metric_type="memory_usage",
-                operator=">",
-                threshold=95.0,
-                severity=AlertSeverity.CRITICAL,
-                cooldown_minutes=2,
-                description="Memory usage above 95% - risk of OOM"
-            ),
-            ThresholdRule(
-                name="Low Disk Space",
-                metric_type="disk_free_gb",
-                operator="<",
-                threshold=5.0,
-                severity=AlertSeverity.NORMAL,
-                cooldown_minutes=30,
-                description="Less than 5GB free disk space"
-            ),
-            ThresholdRule(
-                name="Critical Disk Space",
-                metric_type="disk_free_gb",
-                operator="<",
-                threshold=1.0,
-                severity=AlertSeverity.CRITICAL,
-                cooldown_minutes=15,
-                description="Less than 1GB free disk space"
-            ),
-            ThresholdRule(
-                name="High Load Average",
-                metric_type="load_average_1m",
-                operator=">",
-                threshold=psutil.cpu_count() * 2,  # 2x CPU count
-                severity=AlertSeverity.NORMAL,
-                cooldown_minutes=10,
-                description="High system load - may impact performance"
-            ),
-        ]
+        default_rules = [ThresholdRule(**spec) for spec in _DEFAULT_RULE_SPECS]
+        default_rules.append(ThresholdRule(
+            name="High Load Average",
+            metric_type="load_average_1m",
+            operator=">",
+            threshold=psutil.cpu_count() * 2,  # 2x CPU count
+            severity=AlertSeverity.NORMAL,
+            cooldown_minutes=10,
+            description="High system load - may impact performance"
+        ))
 
         self.rules = default_rules
         self._save_rules()
@@ -194,28 +222,29 @@ class ThresholdMonitor:
                 rule_dict['severity'] = rule.severity.value  # Convert enum to string
                 rules_data.append(rule_dict)
 
+            # Serialize before opening so a failure cannot truncate the file
+            payload = json.dumps(rules_data, indent=2)
             with open(self.rules_file, 'w') as f:
-                json.dump(rules_data, f, indent=2)
+                f.write(payload)
 
         except Exception as e:
             console.print(f"[red]✗[/red] Failed to save threshold rules: {e}")
 
     def _load_last_alert_times(self):
         """Load last alert times for cooldown management."""
-        if self.last_alert_file.exists():
-            try:
-                with open(self.last_alert_file, 'r') as f:
-                    data = json.load(f)
+        try:
+            with open(self.last_alert_file, 'r') as f:
+                data = json.load(f)
 
-                # Convert ISO timestamps back to datetime objects
-                self.last_alert_times = {}
-                for rule_name, timestamp_str in data.items():
-                    self.last_alert_times[rule_name] = datetime.datetime.fromisoformat(timestamp_str)
+            # Convert ISO timestamps back to datetime objects
+            self.last_alert_times = {}
+            for rule_name, timestamp_str in data.items():
+                self.last_alert_times[rule_name] = datetime.datetime.fromisoformat(timestamp_str)
 
-            except Exception as e:
-                console.print(f"[yellow]⚠️[/yellow] Failed to load last alert times: {e}")
-                self.last_alert_times = {}
-        else:
+        except FileNotFoundError:
+            self.last_alert_times = {}
+        except Exception as e:
+            console.print(f"[yellow]⚠️[/yellow] Failed to load last alert times: {e}")
             self.last_alert_times = {}
 
     def _save_last_alert_times(self):
@@ -226,20 +255,27 @@ class ThresholdMonitor:
             for rule_name, timestamp in self.last_alert_times.items():
                 data[rule_name] = timestamp.isoformat()
 
+            payload = json.dumps(data, indent=2)
             with open(self.last_alert_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(payload)
 
         except Exception as e:
             console.print(f"[red]✗[/red] Failed to save last alert times: {e}")
 
-    def collect_system_metrics(self) -> List[SystemMetric]:
-        """Collect current system metrics."""
+    def collect_system_metrics(self, cpu_interval: Optional[float] = 1) -> List[SystemMetric]:
+        """
+        Collect current system metrics.
+
+        Args:
+            cpu_interval: Seconds to block while sampling CPU usage. Pass None to
+                measure since the previous call without blocking.
+        """
         metrics = []
         now = datetime.datetime.now()
 
         try:
             # CPU usage (percentage)
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=cpu_interval)
             metrics.append(SystemMetric("cpu_usage", cpu_percent, "%", now))
 
             # Memory usage (percentage)
@@ -289,6 +325,7 @@ class ThresholdMonitor:
             List of rule names that triggered alerts
         """
         triggered_rules = []
+        now = datetime.datetime.now()
 
         # Create metric lookup
         metric_values = {metric.metric_type: metric.value for metric in metrics}
@@ -305,30 +342,19 @@ class ThresholdMonitor:
 
             # Check cooldown period
             if rule.name in self.last_alert_times:
-                time_since_last = datetime.datetime.now() - self.last_alert_times[rule.name]
+                time_since_last = now - self.last_alert_times[rule.name]
                 if time_since_last.total_seconds() < (rule.cooldown_minutes * 60):
                     continue
 
-            # Evaluate threshold
-            triggered = False
-            if rule.operator == ">" and value > rule.threshold:
-                triggered = True
-            elif rule.operator == ">=" and value >= rule.threshold:
-                triggered = True
-            elif rule.operator == "<" and value < rule.threshold:
-                triggered = True
-            elif rule.operator == "<=" and value <= rule.threshold:
-                triggered = True
-            elif rule.operator == "==" and value == rule.threshold:
-                triggered = True
-
-            if triggered:
+            # Evaluate threshold (unknown operators never trigger)
+            compare = _OPERATORS.get(rule.operator)
+            if compare is not None and compare(value, rule.threshold):
                 # Create alert
                 self._create_threshold_alert(rule, value, metric_values)
                 triggered_rules.append(rule.name)
 
                 # Update last alert time
-                self.last_alert_times[rule.name] = datetime.datetime.now()
+                self.last_alert_times[rule.name] = now
 
         # Save updated alert times
         if triggered_rules:
@@ -380,19 +406,20 @@ class ThresholdMonitor:
         def monitor_loop():
             console.print(f"[green]🔍[/green] Started threshold monitoring (interval: {interval_seconds}s)")
 
+            # Prime the CPU counter so each tick measures usage over the wait
+            # interval instead of blocking for a separate sample
+            psutil.cpu_percent(interval=None)
+
             while not self.stop_event.wait(interval_seconds):
                 try:
                     # Collect metrics
-                    metrics = self.collect_system_metrics()
+                    metrics = self.collect_system_metrics(cpu_interval=None)
 
                     # Store metrics in alert database
-                    for metric in metrics:
-                        self.alert_manager.record_metric(
-                            metric.metric_type,
-                            metric.value,
-                            metric.unit,
-                            metric.source
-                        )
+                    self.alert_manager.record_metrics([
+                        (metric.metric_type, metric.value, metric.unit, metric.source)
+                        for metric in metrics
+                    ])
 
                     # Evaluate thresholds
                     triggered = self.evaluate_thresholds(metrics)
@@ -444,19 +471,21 @@ class ThresholdMonitor:
         """List all threshold rules."""
         return [asdict(rule) for rule in self.rules]
 
-    def get_current_metrics(self) -> Dict[str, Any]:
-        """Get current system metrics as a dictionary."""
-        metrics = self.collect_system_metrics()
-        result = {}
-
-        for metric in metrics:
-            result[metric.metric_type] = {
+    @staticmethod
+    def _metrics_to_dict(metrics: List[SystemMetric]) -> Dict[str, Any]:
+        """Convert collected metrics to a dictionary keyed by metric type."""
+        return {
+            metric.metric_type: {
                 "value": metric.value,
                 "unit": metric.unit,
                 "timestamp": metric.timestamp.isoformat()
             }
+            for metric in metrics
+        }
 
-        return result
+    def get_current_metrics(self) -> Dict[str, Any]:
+        """Get current system metrics as a dictionary."""
+        return self._metrics_to_dict(self.collect_system_metrics())
 
     def manual_check(self) -> Dict[str, Any]:
         """Perform a manual threshold check and return results."""
@@ -465,22 +494,25 @@ class ThresholdMonitor:
 
         return {
             "timestamp": datetime.datetime.now().isoformat(),
-            "metrics": self.get_current_metrics(),
+            "metrics": self._metrics_to_dict(metrics),
             "triggered_rules": triggered,
             "total_rules": len(self.rules),
-            "enabled_rules": len([r for r in self.rules if r.enabled])
+            "enabled_rules": sum(1 for r in self.rules if r.enabled)
         }
 
 
 # Global instance
-_threshold_monitor_instance = None
+_threshold_monitor_instance: Optional[ThresholdMonitor] = None
+_threshold_monitor_lock = threading.Lock()
 
 
 def get_threshold_monitor() -> ThresholdMonitor:
     """Get global threshold monitor instance (singleton pattern)."""
     global _threshold_monitor_instance
     if _threshold_monitor_instance is None:
-        _threshold_monitor_instance = ThresholdMonitor()
+        with _threshold_monitor_lock:
+            if _threshold_monitor_instance is None:
+                _threshold_monitor_instance = ThresholdMonitor()
     return _threshold_monitor_instance
 
 
@@ -20,6 +20,8 @@ import json
 import os
 import sqlite3
 import tempfile
+import threading
+import time
 import unittest
 from decimal import Decimal
 from pathlib import Path
@@ -28,6 +30,8 @@ from unittest.mock import patch, MagicMock
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import cx.system_alert_manager as sys_alert_module
+
 from cx.system_alert_manager import (
     SystemAlertManager,
     AlertType,
@@ -145,6 +149,31 @@ class TestSecurityValidator(unittest.TestCase):
         self.assertFalse(self.validator.validate_json_metadata(object()))
 
 
+class TestJsonHelpers(unittest.TestCase):
+    """Test JSON helpers behave the same with or without orjson."""
+
+    def test_loads_round_trip(self):
+        payload = {"cpu": 85.4, "tags": ["a", "b"], 1: True, "big": 2 ** 70}
+        for orjson_module in (sys_alert_module.orjson, None):
+            with patch.object(sys_alert_module, 'orjson', orjson_module):
+                decoded = sys_alert_module._json_loads(json.dumps(payload))
+                self.assertEqual(decoded, json.loads(json.dumps(payload)))
+
+    def test_loads_accepts_non_finite_floats(self):
+        for orjson_module in (sys_alert_module.orjson, None):
+            with patch.object(sys_alert_module, 'orjson', orjson_module):
+                decoded = sys_alert_module._json_loads(
+                    json.dumps({"v": float("nan"), "inf": float("inf")})
+                )
+                self.assertNotEqual(decoded["v"], decoded["v"])
+                self.assertEqual(decoded["inf"], float("inf"))
+
+    def test_metadata_validation_rejects_non_json_types(self):
+        import uuid
+        for value in (datetime.datetime.now(), uuid.uuid4(), AlertSeverity.CRITICAL):
+            self.assertFalse(SecurityValidator.validate_json_metadata({"t": value}))
+
+
 class TestDataEncryption(unittest.TestCase):
     """Test enterprise data encryption."""
 
@@ -497,6 +526,133 @@ class TestSystemAlertManagerEnterprise(unittest.TestCase):
         self.assertTrue(metrics['security']['encryption_enabled'])
         self.assertTrue(metrics['security']['rate_limiting_enabled'])
 
+    def test_batch_metric_recording(self):
+        """Test recording several metrics in one transaction."""
+        self.assertTrue(self.manager.record_metrics([
+            ("cpu_usage", 42.0, "%", "test"),
+            ("memory_usage", 63.5, "%", "test"),
+            ("disk_free_gb", 120.0, "GB", "test"),
+        ]))
+        self.assertTrue(self.manager.record_metrics([]))
+
+        conn = sqlite3.connect(str(self.test_db_path))
+        try:
+            rows = conn.execute(
+                "SELECT metric_type, value, unit, source, timestamp FROM alert_metrics ORDER BY id"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        self.assertEqual([row[0] for row in rows], ["cpu_usage", "memory_usage", "disk_free_gb"])
+        self.assertEqual(rows[1][1], 63.5)
+        self.assertEqual(len({row[4] for row in rows}), 1)
+
+    def test_bulk_alert_status_update(self):
+        """Test updating several alerts' status in one call."""
+        alert_ids = [
+            self.manager.create_alert(
+                AlertType.SYSTEM_HEALTH,
+                AlertSeverity.NORMAL,
+                "test_source",
+                f"Bulk Alert {i}",
+                "Test message"
+            )
+            for i in range(3)
+        ]
+
+        # Unknown and duplicate IDs are ignored
+        updated = self.manager.update_alerts_status(
+            alert_ids + [alert_ids[0], 9999],
+            AlertStatus.ACKNOWLEDGED,
+            "bulk ack"
+        )
+        self.assertEqual(updated, 3)
+        self.assertEqual(self.manager.update_alerts_status([], AlertStatus.RESOLVED), 0)
+
+        acknowledged = self.manager.query_alerts(status=AlertStatus.ACKNOWLEDGED)
+        self.assertEqual(sorted(alert['id'] for alert in acknowledged), sorted(alert_ids))
+
+        conn = sqlite3.connect(str(self.test_db_path))
+        try:
+            actions = conn.execute("SELECT alert_id, action, comment FROM alert_actions").fetchall()
+        finally:
+            conn.close()
+        self.assertEqual(len(actions), 3)
+        self.assertTrue(all(action[1:] == ('acknowledged', 'bulk ack') for action in actions))
+
+    def test_metric_retention_keeps_newest_rows(self):
+        """Test alert_metrics is pruned to the configured number of rows."""
+        manager = SystemAlertManager(
+            db_path=Path(self.temp_dir.name) / "retention.db",
+            max_metric_rows=10
+        )
+
+        with patch('cx.system_alert_manager.METRIC_PRUNE_INTERVAL', 8):
+            manager.record_metrics([("cpu_usage", float(i), "%", "test") for i in range(20)])
+            manager.record_metric("cpu_usage", 20.0, "%", "test")
+
+        conn = sqlite3.connect(str(manager.db_path))
+        try:
+            values = [row[0] for row in conn.execute("SELECT value FROM alert_metrics ORDER BY id")]
+        finally:
+            conn.close()
+
+        # Pruned after the batch of 20; the single insert is below the interval
+        self.assertEqual(values, [float(i) for i in range(10, 21)])
+
+    def test_failed_metric_prune_keeps_recorded_rows(self):
+        """Test a failing prune neither loses metrics nor defers the retry."""
+        manager = SystemAlertManager(
+            db_path=Path(self.temp_dir.name) / "prune_failure.db",
+            max_metric_rows=10
+        )
+        conn = sqlite3.connect(str(manager.db_path))
+        try:
+            conn.execute("""
+                CREATE TRIGGER block_prune BEFORE DELETE ON alert_metrics
+                BEGIN SELECT RAISE(ABORT, 'prune blocked'); END
+            """)
+            conn.commit()
+
+            with patch('cx.system_alert_manager.METRIC_PRUNE_INTERVAL', 8):
+                self.assertTrue(
+                    manager.record_metrics([("cpu_usage", float(i), "%", "test") for i in range(20)])
+                )
+                count = conn.execute("SELECT COUNT(*) FROM alert_metrics").fetchone()[0]
+                self.assertEqual(count, 20)
+
+                conn.execute("DROP TRIGGER block_prune")
+                conn.commit()
+                # Counter was not reset, so this insert retries the prune
+                manager.record_metric("cpu_usage", 20.0, "%", "test")
+
+            count = conn.execute("SELECT COUNT(*) FROM alert_metrics").fetchone()[0]
+            self.assertEqual(count, 10)
+        finally:
+            conn.close()
+
+    def test_alert_stats_cache_invalidated_on_write(self):
+        """Test cached alert stats are refreshed after alert writes."""
+        self.assertEqual(self.manager.get_alert_stats()['total'], 0)
+
+        alert_id = self.manager.create_alert(
+            AlertType.SYSTEM_HEALTH,
+            AlertSeverity.NORMAL,
+            "test_source",
+            "Test Alert",
+            "Test message"
+        )
+        stats = self.manager.get_alert_stats()
+        self.assertEqual(stats['total'], 1)
+        self.assertEqual(stats['by_status'], {'new': 1})
+
+        # Mutating a returned result must not leak into the cache
+        stats['by_status']['new'] = 99
+        self.assertEqual(self.manager.get_alert_stats()['by_status'], {'new': 1})
+
+        self.manager.update_alert_status(alert_id, AlertStatus.RESOLVED)
+        self.assertEqual(self.manager.get_alert_stats()['by_status'], {'resolved': 1})
+
     def test_health_check_functionality(self):
         """Test comprehensive health check."""
         health = self.manager.health_check()
@@ -514,6 +670,40 @@ class TestSystemAlertManagerEnterprise(unittest.TestCase):
         self.assertTrue(checks['database_connectivity'])
         self.assertTrue(checks['encryption'])
 
+    def test_health_check_reuses_recent_result(self):
+        """Test health check results are reused within the interval."""
+        first = self.manager.health_check()
+        second = self.manager.health_check()
+        self.assertEqual(first['timestamp'], second['timestamp'])
+
+        # Callers get their own copy
+        second['checks'].clear()
+        self.assertIn('encryption', self.manager.health_check()['checks'])
+
+        self.manager.health_check_interval = 0
+        time.sleep(0.01)
+        third = self.manager.health_check()
+        self.assertNotEqual(first['timestamp'], third['timestamp'])
+
+    def test_concurrent_health_checks_probe_once(self):
+        """Test concurrent health checks share a single probe."""
+        probe = self.manager._run_health_check
+        probes = []
+
+        def slow_probe():
+            probes.append(1)
+            time.sleep(0.05)
+            return probe()
+
+        with patch.object(self.manager, '_run_health_check', side_effect=slow_probe):
+            threads = [threading.Thread(target=self.manager.health_check) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(probes), 1)
+
     def test_revenue_event_recording(self):
         """Test revenue event recording with validation."""
         # Create user first
@@ -648,6 +838,33 @@ class TestSecurityCompliance(unittest.TestCase):
             self.assertGreater(len(audit_calls), 0)
 
 
+class TestGlobalAlertManager(unittest.TestCase):
+    """Test the process-wide alert manager accessor."""
+
+    def test_concurrent_first_calls_share_one_instance(self):
+        created = []
+
+        class SlowManager:
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.05)
+
+        results = []
+        with patch.object(sys_alert_module, 'SystemAlertManager', SlowManager), \
+                patch.object(sys_alert_module, '_alert_manager_instance', None):
+            threads = [
+                threading.Thread(target=lambda: results.append(sys_alert_module.get_alert_manager()))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertTrue(all(result is created[0] for result in results))
+
+
 if __name__ == '__main__':
     # Run comprehensive enterprise security tests
     unittest.main(verbosity=2)
\ No newline at end of file